@@ -1,5 +1,6 @@
-from datetime import datetime
-from typing import Any, Callable, Dict
+import time
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from protobuf_to_pydantic.grpc_types import AnyMessage
 
@@ -15,12 +16,18 @@ def to_datetime(value: Any) -> Any:
     return value
 
 
+_number_type_set = {int, float}
+_list_like_type_tuple = (list, tuple)
+
+
 def to_timestamp(value: Any) -> Any:
+    # The rule value is usually a number, return it by an exact type check before the list-like isinstance
     if isinstance(value, datetime):
-        if isinstance(value, (list, tuple)):
-            value = [to_timestamp(i) for i in value]
-        else:
-            value = value.timestamp()
+        return value.timestamp()
+    elif value.__class__ in _number_type_set:
+        return value
+    elif isinstance(value, _list_like_type_tuple):
+        return [to_timestamp(i) for i in value]
     return value
 
 
@@ -149,7 +156,9 @@ def duration_not_in_validator(v: Any, field_name: str, field_value: Any) -> Any:
 #####################
 # timestamp support #
 #####################
-_now_default_factory: Callable[[], datetime] = datetime.now
+# `datetime.now` creates a new bound method each time it is accessed, so keep a reference for the identity check
+_default_now_factory: Callable[[], datetime] = datetime.now
+_now_default_factory: Callable[[], datetime] = _default_now_factory
 
 
 def set_now_default_factory(now_default_factory: Callable[[], datetime]) -> None:
@@ -157,6 +166,26 @@ def set_now_default_factory(now_default_factory: Callable[[], datetime]) -> None
     _now_default_factory = now_default_factory
 
 
+def _get_now_timestamp(field_value: Any) -> float:
+    if hasattr(field_value, "__call__"):
+        return to_timestamp(field_value())
+    elif _now_default_factory is _default_now_factory:
+        # Same as `datetime.now().timestamp()`, but does not need to create a datetime object
+        return time.time()
+    return to_timestamp(_now_default_factory())
+
+
+def _get_now_timestamp_and_tz(field_value: Any) -> Tuple[float, Optional[tzinfo]]:
+    """Same as `_get_now_timestamp`, but also return the tzinfo of now (None means local time)"""
+    if hasattr(field_value, "__call__"):
+        now_time = field_value()
+    elif _now_default_factory is _default_now_factory:
+        return time.time(), None
+    else:
+        now_time = _now_default_factory()
+    return to_timestamp(now_time), getattr(now_time, "tzinfo", None)
+
+
 def timestamp_lt_validator(v: Any, field_name: str, field_value: Any) -> Any:
     _v = to_timestamp(v)
     field_value = to_timestamp(field_value)
@@ -167,12 +196,8 @@ def timestamp_lt_validator(v: Any, field_name: str, field_value: Any) -> Any:
 
 def timestamp_lt_now_validator(v: Any, field_name: str, field_value: Any) -> Any:
     if field_value is not None:
-        if hasattr(field_value, "__call__"):
-            now_time: datetime = field_value()
-        else:
-            now_time = _now_default_factory()
         _v = to_timestamp(v)
-        now_time = to_timestamp(now_time)
+        now_time = _get_now_timestamp(field_value)
         if not _v < now_time:
             raise ValueError(f"{field_name} must < {now_time}, not {_v}")
     return v
@@ -196,12 +221,8 @@ def timestamp_gt_validator(v: Any, field_name: str, field_value: Any) -> Any:
 
 def timestamp_gt_now_validator(v: Any, field_name: str, field_value: Any) -> Any:
     if field_value is not None:
-        if hasattr(field_value, "__call__"):
-            now_time: datetime = field_value()
-        else:
-            now_time = _now_default_factory()
         _v = to_timestamp(v)
-        now_time = to_timestamp(now_time)
+        now_time = _get_now_timestamp(field_value)
         if not _v > now_time:
             raise ValueError(f"{field_name} must > {now_time}, not {_v}")
     return v
@@ -209,17 +230,16 @@ def timestamp_gt_now_validator(v: Any, field_name: str, field_value: Any) -> Any
 
 def timestamp_within_validator(v: Any, field_name: str, field_value: Any) -> Any:
     if field_value is not None:
-        if hasattr(field_value, "__call__"):
-            now_time: datetime = field_value()
-        else:
-            now_time = _now_default_factory()
         _v = to_timestamp(v)
-        after_value = to_timestamp(now_time - field_value)
-        before_value = to_timestamp(now_time + field_value)
+        # Compute the bounds with timestamps, no need to create datetime objects unless the validation fails
+        now_time, now_tz = _get_now_timestamp_and_tz(field_value)
+        within_seconds: float = field_value.total_seconds()
+        after_value = now_time - within_seconds
+        before_value = now_time + within_seconds
         if not (after_value <= _v <= before_value):
             raise ValueError(
-                f"{field_name} must between {now_time - field_value}[{after_value}]"
-                f" and {now_time - field_value}[{before_value}], not {_v}"
+                f"{field_name} must between {datetime.fromtimestamp(after_value, tz=now_tz)}[{after_value}]"
+                f" and {datetime.fromtimestamp(before_value, tz=now_tz)}[{before_value}], not {_v}"
             )
     return v
 
@@ -271,4 +291,7 @@ def map_max_pairs_validator(v: Any, field_name: str, field_value: Any) -> Any:
     return v
 
 
-validate_validator_dict: Dict[str, Callable] = globals()
+# Only the validators can be looked up by name
+validate_validator_dict: Dict[str, Callable] = {
+    name: obj for name, obj in globals().items() if name.endswith("_validator") and callable(obj)
+}
@@ -14,12 +14,11 @@ from protobuf_to_pydantic.field_info_rule.types import OneOfTypedDict  # isort:s
 
 
 def _get_name_value_from_kwargs(key: str, field: ModelField) -> Tuple[str, Any]:
-    field_name: str = field.name
-    if field.field_info.extra:
-        field_value: Any = field.field_info.extra.get(key, None)
-    else:
-        field_value = getattr(field.type_, key, None)
-    return field_name, field_value
+    # Called on every validation, so read `extra` only once
+    extra = field.field_info.extra
+    if extra:
+        return field.name, extra.get(key, None)
+    return field.name, getattr(field.type_, key, None)
 
 
 #################
@@ -211,4 +210,6 @@ def map_max_pairs_validator(cls: Any, v: Any, **kwargs: Any) -> Any:
     return rule.map_max_pairs_validator(v, field_name, field_value)
 
 
-validate_validator_dict: Dict[str, Callable] = globals()
+validate_validator_dict: Dict[str, Callable] = {
+    name: obj for name, obj in globals().items() if name.endswith("_validator") and callable(obj)
+}
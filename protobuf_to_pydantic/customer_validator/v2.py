@@ -14,18 +14,9 @@ from protobuf_to_pydantic.field_info_rule.types import OneOfTypedDict  # isort:s
 ################
 # requirements #
 ################
-def _get_name_and_value(
-    cls: Type[BaseModel], key: str, info: FieldValidationInfo, enable_timestamp_to_datetime: bool = False
-) -> Tuple[str, Any]:
+def _get_name_and_value(cls: Type[BaseModel], key: str, info: FieldValidationInfo) -> Tuple[str, Any]:
     field_name: str = info.field_name
-    field_value = cls.model_fields[field_name].json_schema_extra[key]
-    if enable_timestamp_to_datetime and not isinstance(field_value, datetime):
-        if isinstance(field_value, (list, tuple)):
-            field_value = [datetime.fromtimestamp(i) for i in field_value]
-        else:
-            field_value = datetime.fromtimestamp(field_value)
-
-    return field_name, field_value
+    return field_name, cls.model_fields[field_name].json_schema_extra[key]
 
 
 #################
@@ -147,9 +138,7 @@ def set_now_default_factory(now_default_factory: Callable[[], datetime]) -> None
 
 
 def timestamp_lt_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_lt", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_lt", info)
     return rule.timestamp_lt_validator(v, field_name, field_value)
 
 
@@ -159,16 +148,12 @@ def timestamp_lt_now_validator(cls: Type[BaseModel], v: Any, info: FieldValidati
 
 
 def timestamp_le_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_le", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_le", info)
     return rule.timestamp_le_validator(v, field_name, field_value)
 
 
 def timestamp_gt_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_gt", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_gt", info)
     return rule.timestamp_gt_validator(v, field_name, field_value)
 
 
@@ -183,30 +168,22 @@ def timestamp_within_validator(cls: Type[BaseModel], v: Any, info: FieldValidati
 
 
 def timestamp_ge_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_ge", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_ge", info)
     return rule.timestamp_ge_validator(v, field_name, field_value)
 
 
 def timestamp_const_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_const", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_const", info)
     return rule.timestamp_const_validator(v, field_name, field_value)
 
 
 def timestamp_in_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_in", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_in", info)
     return rule.timestamp_in_validator(v, field_name, field_value)
 
 
 def timestamp_not_in_validator(cls: Type[BaseModel], v: Any, info: FieldValidationInfo) -> Any:
-    field_name, field_value = _get_name_and_value(
-        cls, "timestamp_not_in", info, enable_timestamp_to_datetime=isinstance(v, datetime)
-    )
+    field_name, field_value = _get_name_and_value(cls, "timestamp_not_in", info)
     return rule.timestamp_not_in_validator(v, field_name, field_value)
 
 
@@ -223,4 +200,6 @@ def map_max_pairs_validator(cls: Type[BaseModel], v: Any, info: FieldValidationI
     return rule.map_max_pairs_validator(v, field_name, field_value)
 
 
-validate_validator_dict: Dict[str, Callable] = globals()
+validate_validator_dict: Dict[str, Callable] = {
+    name: obj for name, obj in globals().items() if name.endswith("_validator") and callable(obj)
+}
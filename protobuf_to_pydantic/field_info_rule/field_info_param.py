@@ -2,7 +2,7 @@ import inspect
 import warnings
 from dataclasses import MISSING
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 from pydantic import BaseModel, Field
 from pydantic.fields import FieldInfo
@@ -201,3 +201,45 @@ class FieldInfoParamModel(BaseModel):
 
     def to_dict(self) -> FieldInfoTypedDict:
         return self.dict()  # type: ignore
+
+
+_field_info_param_default_dict: FieldInfoTypedDict = FieldInfoParamModel().to_dict()  # type: ignore[call-arg]
+_none_type: type = type(None)
+# pydantic v1 converts the int value of `Union[float, int, None]` to float, so only float can be used directly
+_number_type_tuple: Tuple[type, ...] = (float, _none_type) if _pydantic_adapter.is_v1 else (float, int, _none_type)
+# The types of value that FieldInfoParamModel returns unchanged
+_field_info_param_passthrough_type_dict: Dict[str, Tuple[type, ...]] = {
+    "enable": (bool,),
+    "required": (bool,),
+    "skip": (bool,),
+    "unique_items": (bool, _none_type),
+    "alias": (str, _none_type),
+    "title": (str, _none_type),
+    "description": (str, _none_type),
+    "regex": (str, _none_type),
+    "gt": _number_type_tuple,
+    "ge": _number_type_tuple,
+    "lt": _number_type_tuple,
+    "le": _number_type_tuple,
+    "min_length": (int, _none_type),
+    "max_length": (int, _none_type),
+    "min_items": (int, _none_type),
+    "max_items": (int, _none_type),
+    "multiple_of": (int, _none_type),
+    "extra": (dict,),
+    "json_schema_extra": (dict,),
+}
+
+
+def gen_field_info_param_dict(field_info_dict: Dict[str, Any]) -> FieldInfoTypedDict:
+    """Same as `FieldInfoParamModel(**field_info_dict).to_dict()`,
+    but if all values already have the expected type, the dict is built directly without model validation"""
+    for key, value in field_info_dict.items():
+        if type(value) not in _field_info_param_passthrough_type_dict.get(key, ()):
+            return FieldInfoParamModel(**field_info_dict).to_dict()
+
+    field_info_param_dict: FieldInfoTypedDict = {**_field_info_param_default_dict, **field_info_dict}  # type: ignore
+    # Like FieldInfoParamModel, always return new dict object
+    field_info_param_dict["extra"] = dict(field_info_param_dict["extra"])
+    field_info_param_dict["json_schema_extra"] = dict(field_info_param_dict["json_schema_extra"])
+    return field_info_param_dict
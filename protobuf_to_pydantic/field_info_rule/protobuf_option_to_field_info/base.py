@@ -48,6 +48,10 @@ special_type_rule_name_set = {
     "min_pairs",
     "max_pairs",
 }
+# The rules of these types are handed over to the validator
+special_type_name_set = {"duration", "any", "timestamp", "map"}
+# PGV rules that are not supported by pydantic and are handed over to the validator
+validator_rule_name_set = {"in", "not_in", "len", "prefix", "suffix", "contains", "not_contains"}
 
 
 def get_con_type_func_from_type_name(type_name: str) -> Optional[Callable]:
@@ -97,9 +101,11 @@ class BaseProtobufOptionToFieldInfo(object):
         Adapt some Field verification information to convert it into verification information that is compatible with
          Protobuf's special type of pydantic
         """
-        field_info_type_dict: FieldInfoTypedDict = {"extra": {}, "skip": False}
+        # `validator` is removed at the end if no validator is generated
+        field_info_type_dict: FieldInfoTypedDict = {"extra": {}, "skip": False, "validator": {}}
+        not_support_rule_name_set = type_not_support_dict.get(field_type, type_not_support_dict["Any"])
         for rule_name, rule_value in rule_dict.items():
-            if rule_name in type_not_support_dict.get(field_type, type_not_support_dict["Any"]):
+            if rule_name in not_support_rule_name_set:
                 # Exclude unsupported fields
                 if field_type in protobuf_common_type_dict:
                     rule_name = f"{protobuf_common_type_dict[field_type]}.{rule_name}"
@@ -115,18 +121,14 @@ class BaseProtobufOptionToFieldInfo(object):
             if is_change:
                 rule_value = new_rule_value
 
-            if rule_name in pgv_column_to_pydantic_dict:
-                # Field Conversion
-                rule_name = pgv_column_to_pydantic_dict[rule_name]
+            # Field Conversion
+            rule_name = pgv_column_to_pydantic_dict.get(rule_name, rule_name)
 
-            if type_name in ("duration", "any", "timestamp", "map") and rule_name in special_type_rule_name_set:
+            if type_name in special_type_name_set and rule_name in special_type_rule_name_set:
                 # The verification of these parameters is handed over to the validator,
                 # see protobuf_to_pydantic/customer_validator for details
 
                 # Types of priority treatment for special cases
-                if "validator" not in field_info_type_dict:
-                    field_info_type_dict["validator"] = {}
-
                 _rule_name: str = f"{type_name}_{rule_name}"
                 validator_name = f"{field_name}_{_rule_name}_validator"
 
@@ -137,16 +139,14 @@ class BaseProtobufOptionToFieldInfo(object):
                     field_name, allow_reuse=True
                 )(validate_validator_dict[f"{_rule_name}_validator"])
                 continue
-            elif rule_name in ("in", "not_in", "len", "prefix", "suffix", "contains", "not_contains"):
+            elif rule_name in validator_rule_name_set:
                 # The verification of these parameters is handed over to the validator,
                 # see protobuf_to_pydantic/customer_validator for details
 
                 # Compatible with PGV attributes that are not supported by pydantic
-                if "validator" not in field_info_type_dict:
-                    field_info_type_dict["validator"] = {}
                 validator_name = f"{field_name}_{rule_name}_validator"
                 # dict key not use python keyword
-                _rule_name = rule_name + "_" if rule_name in ("in",) else rule_name
+                _rule_name = rule_name + "_" if rule_name == "in" else rule_name
                 field_info_type_dict["extra"][_rule_name] = self.rule_value_to_field_value_handler(
                     type_name, rule_name, rule_value
                 )
@@ -212,6 +212,8 @@ class BaseProtobufOptionToFieldInfo(object):
                 field_info_type_dict["sub"] = sub_dict
 
             field_info_type_dict[rule_name] = rule_value  # type: ignore
+        if not field_info_type_dict["validator"]:
+            del field_info_type_dict["validator"]
         return field_info_type_dict
 
 
@@ -105,12 +105,10 @@ def gen_field_info_dict_from_field_desc(
     else:
         raise RuntimeError(f"Not support type:{field.type}")
 
+    rule_option_name_suffix = f"{protobuf_pkg}.rules" if protobuf_pkg else "validate.rules"
     for option_descriptor, option_value in field_list:
         # filter unwanted Option
-        if protobuf_pkg:
-            if not option_descriptor.full_name.endswith(f"{protobuf_pkg}.rules"):
-                continue
-        elif not option_descriptor.full_name.endswith("validate.rules"):
+        if not option_descriptor.full_name.endswith(rule_option_name_suffix):
             continue
 
         rule_message: Any = option_value.message
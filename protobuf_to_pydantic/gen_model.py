@@ -4,8 +4,11 @@ import importlib
 import inspect
 import os
 from enum import IntEnum
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -16,9 +19,9 @@ from protobuf_to_pydantic.constant import protobuf_common_type_dict
 from protobuf_to_pydantic.customer_validator import check_one_of
 from protobuf_to_pydantic.exceptions import WaitingToCompleteException
 from protobuf_to_pydantic.field_info_rule.field_info_param import (
-    FieldInfoParamModel,
     field_info_param_dict_handle,
     field_info_param_dict_migration_v2_handler,
+    gen_field_info_param_dict,
 )
 from protobuf_to_pydantic.field_info_rule.protobuf_option_to_field_info.comment import (
     gen_field_rule_info_dict_from_field_comment_dict,
@@ -38,8 +41,11 @@ if TYPE_CHECKING:
 
 SKIP_RULE_MESSAGE_SUFFIX = "WithSkipRule"
 ALLOW_ARBITRARY_TYPE = (AnyMessage, FieldMask)
+# Used to build the member dict of the enum class from the enum values descriptor
+_get_enum_value_name_and_number = attrgetter("name", "number")
 
 
+@lru_cache(maxsize=None)
 def replace_file_name_to_class_name(filename: str) -> str:
     """Convert the protobuf file name to the class name(PEP-8)"""
     # example_proto/common/single.proto -> Example_protoCommonSingle
@@ -49,7 +55,37 @@ def replace_file_name_to_class_name(filename: str) -> str:
     return prefix
 
 
+@lru_cache(maxsize=None)
+def get_google_protobuf_type(file_name: str, message_name: str) -> Any:
+    """Get the Python class of the `google/protobuf/*.proto` message"""
+    # google/protobuf/wrappers.proto -> google.protobuf.wrappers_pb2
+    module_name = file_name.split(".")[0].replace("/", ".") + "_pb2"
+    return getattr(importlib.import_module(module_name), message_name)
+
+
+# The pydantic version is fixed at import time, so choose the version-specific implementation only once
+if _pydantic_adapter.is_v1:
+
+    def gen_pydantic_config_attr_dict(pydantic_base: Type[BaseModel], config_dict: Dict[str, Any]) -> Dict[str, Any]:
+        config_class = pydantic_base.Config  # type: ignore
+        return {"Config": type(config_class.__name__, (config_class,), config_dict)}
+
+    def field_info_param_dict_version_handler(field_info_param_dict: Dict[str, Any]) -> None:
+        pass
+
+else:
+    from pydantic import ConfigDict
+
+    def gen_pydantic_config_attr_dict(pydantic_base: Type[BaseModel], config_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {"model_config": ConfigDict(**config_dict)}  # type: ignore[typeddict-item]
+
+    field_info_param_dict_version_handler = field_info_param_dict_migration_v2_handler
+
+
 class CodeRefModel(object):
+    # An instance is attached to every generated model, so avoid the per-instance `__dict__`
+    __slots__ = ("one_of_dict", "base_model", "nested_message_dict", "validators")
+
     def __init__(
         self,
         one_of_dict: Dict[str, "UseOneOfTypedDict"],
@@ -90,6 +126,19 @@ class CodeRefModel(object):
 
 @dataclasses.dataclass
 class FieldDataClass(object):
+    # One instance is created per protobuf field, use `__slots__` to reduce memory and speed up attribute access
+    # (`dataclass(slots=True)` requires Python 3.10+, and no field has a default value, so it can be declared directly)
+    __slots__ = (
+        "field_name",
+        "field_type",
+        "field_type_name",
+        "field_default",
+        "field_default_factory",
+        "protobuf_field",
+        "nested_message_dict",
+        "descriptor",
+        "validators",
+    )
     # field data
     field_name: str
     field_type: Any
@@ -111,6 +160,32 @@ def clear_create_model_cache() -> None:
     _create_model_cache.clear()
 
 
+def _get_create_model_cache_key(
+    descriptor: Descriptor, class_name: str = "", skip_validate_rule: bool = False
+) -> Tuple[str, str, bool]:
+    """Get the key of the generated model in the create model cache"""
+    return descriptor.full_name, class_name or descriptor.name, skip_validate_rule
+
+
+def _check_parse_msg_desc_method(msg: Union[Type[Message], Descriptor], parse_msg_desc_method: Any) -> None:
+    """Check if the parse_msg_desc_method param can be used to extract the message option of msg"""
+    proto_file_name = msg.DESCRIPTOR.file.name  # type: ignore
+    if proto_file_name.endswith("empty.proto") or parse_msg_desc_method in (None, "ignore", "PGV"):
+        return
+    elif isinstance(parse_msg_desc_method, str) and Path(parse_msg_desc_method).exists():
+        return
+    elif inspect.ismodule(parse_msg_desc_method):
+        if getattr(parse_msg_desc_method, msg.__name__, None) is not msg:  # type: ignore
+            raise ValueError(f"Not the module corresponding to {msg}")
+        if not Path(parse_msg_desc_method.__file__ + "i").exists():  # type: ignore
+            raise RuntimeError(f"Can not found {msg} pyi file")
+        return
+    raise ValueError(
+        f"parse_msg_desc_method param must be exist path, `ignore` or `PGV`,"
+        f" not {parse_msg_desc_method}), now path:{os.getcwd()}"
+    )
+
+
 class M2P(object):
     def __init__(
         self,
@@ -127,6 +202,7 @@ class M2P(object):
         all_field_set_optional: bool = False,
         create_model_cache: Optional[CREATE_MODEL_CACHE_T] = None,
     ):
+        _check_parse_msg_desc_method(msg, parse_msg_desc_method)
         proto_file_name = msg.DESCRIPTOR.file.name  # type: ignore
         global_message_option_dict: Dict[str, "MessageOptionTypedDict"] = {}
 
@@ -142,20 +218,11 @@ class M2P(object):
             )
         elif inspect.ismodule(parse_msg_desc_method):
             # get field dict from pyi file
-            if getattr(parse_msg_desc_method, msg.__name__, None) is not msg:  # type: ignore
-                raise ValueError(f"Not the module corresponding to {msg}")
             pyi_file_name = parse_msg_desc_method.__file__ + "i"  # type: ignore
-            if not Path(pyi_file_name).exists():
-                raise RuntimeError(f"Can not found {msg} pyi file")
             global_message_option_dict = get_message_option_dict_from_pyi_file(pyi_file_name, comment_prefix)
         elif parse_msg_desc_method == "PGV":
             # get field dict from pgv
             global_message_option_dict = get_message_option_dict_from_message_with_pgv(message=msg)  # type: ignore
-        elif parse_msg_desc_method is not None:
-            raise ValueError(
-                f"parse_msg_desc_method param must be exist path, `ignore` or `PGV`,"
-                f" not {parse_msg_desc_method}), now path:{os.getcwd()}"
-            )
         else:
             # get field dict from p2p
             global_message_option_dict = get_message_option_dict_from_message_with_p2p(message=msg)  # type: ignore
@@ -167,6 +234,9 @@ class M2P(object):
         self._comment_prefix = comment_prefix
         self._creat_cache: CREATE_MODEL_CACHE_T = create_model_cache or _create_model_cache
         self._pydantic_base: Type["BaseModel"] = pydantic_base or BaseModel
+        self._arbitrary_types_allowed: bool = bool(
+            _pydantic_adapter.get_model_config_value(self._pydantic_base, "arbitrary_types_allowed")
+        )
         self._pydantic_module: str = pydantic_module or __name__
         self._comment_template: Template = (template or Template)(local_dict or {}, self._comment_prefix)
         self._message_type_dict_by_type_name: Dict[str, Any] = (
@@ -175,6 +245,16 @@ class M2P(object):
         self._message_default_factory_dict_by_type_name: Dict[str, Any] = (
             message_default_factory_dict_by_type_name or constant.message_name_default_factory_dict
         )
+        # The message option dict is not modified after init, so the lookup result of each field can be reused
+        self._field_info_cache: Dict[str, Optional["FieldInfoTypedDict"]] = {}
+        self._one_of_cache: Dict[str, Tuple[Dict[str, "UseOneOfTypedDict"], Dict[str, Any]]] = {}
+        self._enum_cache: Dict[Tuple[str, str], Type[IntEnum]] = {}
+        self._class_name_and_doc_cache: Dict[Tuple[str, str, str], Tuple[bool, str, str]] = {}
+        self._pydantic_base_cache: Dict[FrozenSet[Tuple[str, Any]], Type[BaseModel]] = {}
+        self._field_type_handler_dict: Dict[int, Callable[[FieldDataClass], None]] = {
+            FieldDescriptor.TYPE_MESSAGE: self._protobuf_field_type_is_type_message_handler,
+            FieldDescriptor.TYPE_ENUM: self._protobuf_field_type_is_type_enum_handler,
+        }
 
         self._gen_model: Type[BaseModel] = self._parse_msg_to_pydantic_model(
             descriptor=msg if isinstance(msg, Descriptor) else msg.DESCRIPTOR,
@@ -197,19 +277,23 @@ class M2P(object):
     # util method #
     ###############
     def _get_field_info_dict_by_full_name(self, full_name: str) -> Optional["FieldInfoTypedDict"]:
+        field_info_dict = self._field_info_cache.get(full_name, dataclasses.MISSING)
+        if field_info_dict is dataclasses.MISSING:
+            field_info_dict = self._search_field_info_dict_by_full_name(full_name)
+            self._field_info_cache[full_name] = field_info_dict
+        return field_info_dict  # type: ignore[return-value]
+
+    def _search_field_info_dict_by_full_name(self, full_name: str) -> Optional["FieldInfoTypedDict"]:
         split_full_name = full_name.split(".")
-        if len(split_full_name) == 2:
-            message_name, *key_list = split_full_name
-        else:
-            # TODO Maybe fix the problem that multiple packages have the same message
-            message_name, *key_list = split_full_name[1:]  # ignore package name
-        if message_name not in self._message_option_dict:
-            return None
-        message_option_dict: "MessageOptionTypedDict" = self._message_option_dict[message_name]
-        if message_option_dict["metadata"].get("ignore", False):
+        # TODO Maybe fix the problem that multiple packages have the same message
+        message_index = 0 if len(split_full_name) == 2 else 1  # ignore package name
+        message_option_dict: Optional["MessageOptionTypedDict"] = self._message_option_dict.get(
+            split_full_name[message_index], None
+        )
+        if message_option_dict is None or message_option_dict["metadata"].get("ignore", False):
             return None
 
-        for key in key_list:
+        for key in islice(split_full_name, message_index + 1, None):
             if key in message_option_dict["message"]:
                 return message_option_dict["message"][key]
             elif key in message_option_dict["nested"]:
@@ -220,7 +304,34 @@ class M2P(object):
                 return None
         return None
 
+    def _get_class_name_and_doc(self, file_name: str, type_file_name: str, type_name: str) -> Tuple[bool, str, str]:
+        """Get the class name and doc of the message/enum type used by the field in the file
+
+        :return: whether the type is in the same package, class name, class doc
+        """
+        cache_key = (file_name, type_file_name, type_name)
+        result = self._class_name_and_doc_cache.get(cache_key, None)
+        if result is None:
+            if file_name == type_file_name:
+                result = (True, type_name, "")
+            else:
+                class_name = replace_file_name_to_class_name(type_file_name) + type_name
+                class_doc = (
+                    "Note: The current class does not belong to the package\n"
+                    f"{class_name} protobuf path:{type_file_name}"
+                )
+                result = (False, class_name, class_doc)
+            self._class_name_and_doc_cache[cache_key] = result
+        return result
+
     def _one_of_handle(self, descriptor: Descriptor) -> Tuple[Dict[str, "UseOneOfTypedDict"], Dict[str, Any]]:
+        # The same descriptor may be parsed more than once (e.g. skip rule message), so reuse the result
+        one_of_result = self._one_of_cache.get(descriptor.full_name, None)
+        if one_of_result is None:
+            one_of_result = self._one_of_cache[descriptor.full_name] = self._gen_one_of_dict(descriptor)
+        return one_of_result
+
+    def _gen_one_of_dict(self, descriptor: Descriptor) -> Tuple[Dict[str, "UseOneOfTypedDict"], Dict[str, Any]]:
         message_option_dict: "MessageOptionTypedDict" = self._message_option_dict.get(
             descriptor.name, {"message": {}, "one_of": {}, "nested": {}, "metadata": {}}
         )
@@ -254,37 +365,30 @@ class M2P(object):
             if field_full_name in optional_id_set:
                 continue
 
-            if field_full_name not in one_of_dict:
-                one_of_dict[field_full_name] = {"required": False, "fields": set()}
-            # pyi file not include pkg info
-            for found_column_name in [field_full_name, ".".join(field_full_name.split(".")[1:])]:
-                if found_column_name not in one_of_desc_dict:
-                    continue
-                # only PGV or P2P support
-                one_of_dict[field_full_name]["required"] = one_of_desc_dict[found_column_name].get("required", False)
-                optional_fields = one_of_desc_dict[found_column_name].get("optional_fields", set())
-                if optional_fields:
-                    for field_name in optional_fields:
+            # the one_of full name is unique in the message, so the entry can be created directly with all fields
+            one_of_dict[field_full_name] = {"required": False, "fields": {_field.name for _field in one_of.fields}}
+            if one_of_desc_dict:
+                # pyi file not include pkg info
+                for found_column_name in (field_full_name, field_full_name.partition(".")[2]):
+                    one_of_desc = one_of_desc_dict.get(found_column_name, None)
+                    if one_of_desc is None:
+                        continue
+                    # only PGV or P2P support
+                    one_of_dict[field_full_name]["required"] = one_of_desc.get("required", False)
+                    for field_name in one_of_desc.get("optional_fields", None) or ():
                         optional_dict[descriptor.full_name + "." + field_name] = {"is_proto3_optional": True}
-
-            for _field in one_of.fields:
-                one_of_dict[field_full_name]["fields"].add(_field.name)
         return one_of_dict, optional_dict
 
     def _get_pydantic_base(self, config_dict: Dict[str, Any]) -> Type[BaseModel]:
         if config_dict:
-            if _pydantic_adapter.is_v1:
-                config_class = self._pydantic_base.Config  # type: ignore
-                _config_dict: Dict[str, Any] = {"Config": type(config_class.__name__, (config_class,), config_dict)}
-            else:
-                from pydantic import ConfigDict
-
-                _config_dict = {"model_config": ConfigDict(**config_dict)}  # type: ignore[typeddict-item]
-
-            # Changing the configuration of Config by inheritance
-            pydantic_base: Type[BaseModel] = type(  # type: ignore
-                self._pydantic_base.__name__, (self._pydantic_base,), _config_dict
-            )
+            # Models with the same config can share the same base
+            cache_key = frozenset(config_dict.items())
+            pydantic_base: Optional[Type[BaseModel]] = self._pydantic_base_cache.get(cache_key, None)
+            if pydantic_base is None:
+                _config_dict: Dict[str, Any] = gen_pydantic_config_attr_dict(self._pydantic_base, config_dict)
+                # Changing the configuration of Config by inheritance
+                pydantic_base = type(self._pydantic_base.__name__, (self._pydantic_base,), _config_dict)  # type: ignore
+                self._pydantic_base_cache[cache_key] = pydantic_base
         else:
             pydantic_base = self._pydantic_base
         return pydantic_base
@@ -299,7 +403,7 @@ class M2P(object):
             nested_message_dict[message.full_name] = nested_type
         # enum support
         for enum_type in descriptor.enum_types:
-            class_dict: dict = {v.name: v.number for v in enum_type.values}
+            class_dict: dict = dict(map(_get_enum_value_name_and_number, enum_type.values))
             class_dict["__doc__"] = ""
             nested_type = IntEnum(enum_type.name, class_dict)  # type: ignore
             nested_message_dict[enum_type.full_name] = nested_type
@@ -310,16 +414,19 @@ class M2P(object):
     ####################
     def _protobuf_field_type_is_type_message_handler(self, field_dataclass: FieldDataClass) -> None:
         protobuf_field = field_dataclass.protobuf_field
-        if protobuf_field.message_type.name in self._message_type_dict_by_type_name:
+        message_type_name: str = protobuf_field.message_type.name
+        message_type = self._message_type_dict_by_type_name.get(message_type_name, dataclasses.MISSING)
+        if message_type is not dataclasses.MISSING:
             # Timestamp, Struct, Empty, Duration, Any support
-            field_dataclass.field_type_name = protobuf_field.message_type.name.lower()
-            field_dataclass.field_type = self._message_type_dict_by_type_name[protobuf_field.message_type.name]
-            if protobuf_field.message_type.name in self._message_default_factory_dict_by_type_name:
+            field_dataclass.field_type_name = message_type_name.lower()
+            field_dataclass.field_type = message_type
+            default_factory = self._message_default_factory_dict_by_type_name.get(
+                message_type_name, dataclasses.MISSING
+            )
+            if default_factory is not dataclasses.MISSING:
                 # Default factory has a higher priority
-                field_dataclass.field_default_factory = self._message_default_factory_dict_by_type_name[
-                    protobuf_field.message_type.name
-                ]
-        elif protobuf_field.message_type.name.endswith("Entry"):
+                field_dataclass.field_default_factory = default_factory
+        elif message_type_name.endswith("Entry"):
             # support google.protobuf.MapEntry
             # key, value = column.message_type.fields
             field_dataclass.field_type_name = "map"
@@ -327,17 +434,20 @@ class M2P(object):
             for k_v_field in protobuf_field.message_type.fields:
                 if not k_v_field.message_type:
                     k_v_type: Any = constant.protobuf_desc_python_type_dict[k_v_field.type]
-                elif k_v_field.message_type.name in self._message_type_dict_by_type_name:
-                    k_v_type = self._message_type_dict_by_type_name[k_v_field.message_type.name]
                 else:
-                    k_v_type = self._parse_msg_to_pydantic_model(descriptor=k_v_field.message_type)
+                    k_v_type = self._message_type_dict_by_type_name.get(
+                        k_v_field.message_type.name, dataclasses.MISSING
+                    )
+                    if k_v_type is dataclasses.MISSING:
+                        k_v_type = self._parse_msg_to_pydantic_model(descriptor=k_v_field.message_type)
                 dict_type_param_list.append(k_v_type)
 
             field_dataclass.field_type = Dict[tuple(dict_type_param_list)]  # type: ignore
             field_dataclass.field_default_factory = dict
         elif protobuf_field.message_type.file.name.startswith("google/protobuf/"):
-            module_name = protobuf_field.message_type.file.name.split(".")[0].replace("/", ".") + "_pb2"
-            type_factory = getattr(importlib.import_module(module_name), protobuf_field.message_type.name)
+            type_factory = get_google_protobuf_type(
+                protobuf_field.message_type.file.name, protobuf_field.message_type.name
+            )
             field_dataclass.field_type = type_factory
             field_dataclass.field_default_factory = type_factory
         else:
@@ -351,9 +461,9 @@ class M2P(object):
                 _cache_full_name = full_name + SKIP_RULE_MESSAGE_SUFFIX if skip_validate_rule else full_name
                 if _cache_full_name not in field_dataclass.nested_message_dict:
                     # found and gen new message, finally, register to nested_message_dict
-                    nested_message = [i for i in field_dataclass.descriptor.nested_types if i.full_name == full_name][0]
+                    # (the nested type whose full name is `full_name` is the field's message type itself)
                     nested_type: Any = self._parse_msg_to_pydantic_model(
-                        descriptor=nested_message,
+                        descriptor=protobuf_field.message_type,
                         class_name=protobuf_field.message_type.name + SKIP_RULE_MESSAGE_SUFFIX,
                         skip_validate_rule=skip_validate_rule,
                     )
@@ -362,25 +472,23 @@ class M2P(object):
                 else:
                     field_dataclass.field_type = field_dataclass.nested_message_dict[full_name]
                 # Facilitate the analysis of `gen code`
-                setattr(field_dataclass.field_type, "_is_nested", True)
+                field_dataclass.field_type._is_nested = True  # type: ignore[union-attr]
             else:
                 # Python Protobuf does not solve the namespace problem of modules,
                 # so there is no uniform cross-module reference
                 # see issue: https://github.com/protocolbuffers/protobuf/issues/1491
-                is_same_pkg: bool = field_dataclass.descriptor.file.name == protobuf_field.message_type.file.name
-                _class_name: str = protobuf_field.message_type.name
+                is_same_pkg, _class_name, _class_doc = self._get_class_name_and_doc(
+                    field_dataclass.descriptor.file.name,
+                    protobuf_field.message_type.file.name,
+                    protobuf_field.message_type.name,
+                )
                 if not is_same_pkg:
-                    _class_name = replace_file_name_to_class_name(protobuf_field.message_type.file.name) + _class_name
                     field_dataclass.field_type = self._parse_msg_to_pydantic_model(
                         descriptor=protobuf_field.message_type,
                         class_name=_class_name,
                         skip_validate_rule=skip_validate_rule,
                     )
-                    _class_doc: str = (
-                        "Note: The current class does not belong to the package\n"
-                        f"{_class_name} protobuf path:{protobuf_field.message_type.file.name}"
-                    )
-                    setattr(field_dataclass.field_type, "__doc__", _class_doc)
+                    field_dataclass.field_type.__doc__ = _class_doc
                 else:
                     # if self-referencing, need use Python type hints postponed annotations
                     field_dataclass.field_type = f'"{_class_name}"'
@@ -405,19 +513,21 @@ class M2P(object):
         if protobuf_field.enum_type.full_name in field_dataclass.nested_message_dict:
             field_dataclass.field_type = field_dataclass.nested_message_dict[protobuf_field.enum_type.full_name]
             # Facilitate the analysis of `gen code`
-            setattr(field_dataclass.field_type, "_is_nested", True)
+            field_dataclass.field_type._is_nested = True  # type: ignore[union-attr]
         else:
-            enum_class_dict = {v.name: v.number for v in protobuf_field.enum_type.values}
-            _class_name = protobuf_field.enum_type.name
-            _class_doc = ""
-            if field_dataclass.descriptor.file.name != protobuf_field.enum_type.file.name:
-                _class_name = replace_file_name_to_class_name(protobuf_field.enum_type.file.name) + _class_name
-                _class_doc = (
-                    "Note: The current class does not belong to the package\n"
-                    f"{_class_name} protobuf path:{protobuf_field.enum_type.file.name}"
-                )
-            enum_class_dict["__doc__"] = _class_doc
-            field_dataclass.field_type = IntEnum(_class_name, enum_class_dict)  # type: ignore
+            _, _class_name, _class_doc = self._get_class_name_and_doc(
+                field_dataclass.descriptor.file.name,
+                protobuf_field.enum_type.file.name,
+                protobuf_field.enum_type.name,
+            )
+            # The same enum may be referenced by many messages, only create its class once
+            enum_key = (protobuf_field.enum_type.full_name, _class_name)
+            enum_class = self._enum_cache.get(enum_key, None)
+            if enum_class is None:
+                enum_class_dict = dict(map(_get_enum_value_name_and_number, protobuf_field.enum_type.values))
+                enum_class_dict["__doc__"] = _class_doc
+                enum_class = self._enum_cache[enum_key] = IntEnum(_class_name, enum_class_dict)  # type: ignore
+            field_dataclass.field_type = enum_class
 
     def _protobuf_field_lable_is_label_repeated_handler(self, field_dataclass: FieldDataClass) -> None:
         # support google.protobuf.array
@@ -449,7 +559,7 @@ class M2P(object):
                 )
 
             raw_validator_dict = field_info_dict.get("validator", {})
-            field_info_dict: FieldInfoTypedDict = FieldInfoParamModel(**field_info_dict).dict()  # type: ignore
+            field_info_dict: FieldInfoTypedDict = gen_field_info_param_dict(field_info_dict)  # type: ignore
             field_info_dict.pop("skip")
             # Nested types do not include the `enable`, `field` and `validator`  attributes
             if not field_info_dict.pop("enable"):
@@ -517,8 +627,7 @@ class M2P(object):
                 "default_factory": field_dataclass.field_default_factory,
                 "extra": {},
             }
-        if not _pydantic_adapter.is_v1:
-            field_info_param_dict_migration_v2_handler(field_info_dict)  # type: ignore[arg-type]
+        field_info_param_dict_version_handler(field_info_dict)  # type: ignore[arg-type]
 
         for remove_key in ("extra", "json_schema_extra"):
             if not field_info_dict.get(remove_key, True):  # type: ignore[misc]
@@ -530,13 +639,13 @@ class M2P(object):
         self, *, descriptor: Descriptor, class_name: str = "", skip_validate_rule: bool = False
     ) -> Type[BaseModel]:
         class_name = class_name or descriptor.name
-        message_key = (descriptor.full_name, class_name, skip_validate_rule)
-        if message_key in self._creat_cache:
-            if self._creat_cache[message_key] is None:
-                raise WaitingToCompleteException(f"The model:{message_key} is being generated")
-            return self._creat_cache[message_key]  # type: ignore[return-value]
-        else:
-            self._creat_cache[message_key] = None
+        message_key = _get_create_model_cache_key(descriptor, class_name, skip_validate_rule)
+        cache_model = self._creat_cache.get(message_key, dataclasses.MISSING)
+        if cache_model is None:
+            raise WaitingToCompleteException(f"The model:{message_key} is being generated")
+        elif cache_model is not dataclasses.MISSING:
+            return cache_model  # type: ignore[return-value]
+        self._creat_cache[message_key] = None
 
         annotation_dict: Dict[str, Tuple[Type, Any]] = {}
         validators: Dict[str, classmethod] = {}
@@ -544,43 +653,58 @@ class M2P(object):
         nested_message_dict = self.get_nested_message_dict_by_message(descriptor)
         one_of_dict, optional_dict = self._one_of_handle(descriptor)
 
+        # Bind the objects used for each field to local variables to reduce attribute lookups in the loop
+        pydantic_undefined = _pydantic_adapter.PydanticUndefined
+        label_repeated = FieldDescriptor.LABEL_REPEATED
+        get_python_type = constant.protobuf_desc_python_type_dict.get
+        get_common_type_name = protobuf_common_type_dict.get
+        get_field_type_handler = self._field_type_handler_dict.get
+        all_field_set_optional = self._all_field_set_optional
+        arbitrary_types_allowed = self._arbitrary_types_allowed
+
+        # The field data is only used within one iteration, so a single instance is reset and reused for each field
+        field_dataclass = FieldDataClass(
+            field_name="",
+            field_type=None,
+            field_type_name="",
+            field_default=pydantic_undefined,
+            field_default_factory=None,
+            protobuf_field=None,  # type: ignore[arg-type]
+            nested_message_dict=nested_message_dict,
+            descriptor=descriptor,
+            validators=validators,
+        )
         # parse field
         for protobuf_field in descriptor.fields:
-            field_dataclass = FieldDataClass(
-                field_name=protobuf_field.name,
-                field_type=constant.protobuf_desc_python_type_dict.get(protobuf_field.type, None),
-                field_type_name=protobuf_common_type_dict.get(protobuf_field.type, None),  # type: ignore
-                field_default=_pydantic_adapter.PydanticUndefined,
-                field_default_factory=None,
-                protobuf_field=protobuf_field,
-                nested_message_dict=nested_message_dict,
-                descriptor=descriptor,
-                validators=validators,
-            )
-            if protobuf_field.type == FieldDescriptor.TYPE_MESSAGE:
-                self._protobuf_field_type_is_type_message_handler(field_dataclass)
-            elif protobuf_field.type == FieldDescriptor.TYPE_ENUM:
-                self._protobuf_field_type_is_type_enum_handler(field_dataclass)
+            field_dataclass.field_name = protobuf_field.name
+            field_dataclass.field_type = get_python_type(protobuf_field.type, None)
+            field_dataclass.field_type_name = get_common_type_name(protobuf_field.type, None)  # type: ignore
+            field_dataclass.field_default = pydantic_undefined
+            field_dataclass.field_default_factory = None
+            field_dataclass.protobuf_field = protobuf_field
+            field_type_handler = get_field_type_handler(protobuf_field.type, None)
+            if field_type_handler:
+                field_type_handler(field_dataclass)
             else:
                 field_dataclass.field_default = protobuf_field.default_value
 
             # At this time, the field type may be modified by the above logic, so it needs to be handled separately
-            if protobuf_field.label == FieldDescriptor.LABEL_REPEATED:
+            if protobuf_field.label == label_repeated:
                 self._protobuf_field_lable_is_label_repeated_handler(field_dataclass)
             field_info = self._gen_field_info(field_dataclass, skip_validate_rule)
             if not field_info:
                 continue
 
+            # The handlers have finished modifying the field type, read it only once
+            field_type = field_dataclass.field_type
             is_proto3_optional = optional_dict.get(protobuf_field.full_name, {}).get("is_proto3_optional", False)
-            if is_proto3_optional or self._all_field_set_optional:
-                field_dataclass.field_type = Optional[field_dataclass.field_type]
-                if field_info.default is _pydantic_adapter.PydanticUndefined and field_info.default_factory is None:
+            if is_proto3_optional or all_field_set_optional:
+                field_type = Optional[field_type]
+                if field_info.default is pydantic_undefined and field_info.default_factory is None:
                     field_info.default = None
-            annotation_dict[field_dataclass.field_name] = (field_dataclass.field_type, field_info)
+            annotation_dict[field_dataclass.field_name] = (field_type, field_info)
 
-            if field_dataclass.field_type in ALLOW_ARBITRARY_TYPE and not _pydantic_adapter.get_model_config_value(
-                self._pydantic_base, "arbitrary_types_allowed"
-            ):
+            if not arbitrary_types_allowed and field_type in ALLOW_ARBITRARY_TYPE:
                 pydantic_model_config_dict["arbitrary_types_allowed"] = True
 
         if one_of_dict:
@@ -662,6 +786,13 @@ def msg_to_pydantic_model(
     :param all_field_set_optional: If true, all fields become optional,
         see: https://github.com/so1n/protobuf_to_pydantic/issues/60
     """
+    # The param check of M2P should not be skipped when the model has been generated
+    _check_parse_msg_desc_method(msg, parse_msg_desc_method)
+    # If the model has been generated, return it directly to skip the parsing of the message option by M2P
+    descriptor: Descriptor = msg if isinstance(msg, Descriptor) else msg.DESCRIPTOR  # type: ignore[assignment]
+    cache_model = (create_model_cache or _create_model_cache).get(_get_create_model_cache_key(descriptor), None)
+    if cache_model is not None:
+        return cache_model
     return M2P(
         msg=msg,
         default_field=default_field,
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict, Set, Type
+from threading import Lock
+from typing import Dict, Set, Tuple, Type
 
 from protobuf_to_pydantic.constant import protobuf_common_type_dict
 from protobuf_to_pydantic.field_info_rule.protobuf_option_to_field_info.desc import gen_field_info_dict_from_field_desc
@@ -9,6 +10,18 @@ from protobuf_to_pydantic.grpc_types import Descriptor, FieldDescriptor, Message
 _logger: logging.Logger = logging.getLogger(__name__)
 
 _global_message_option_dict: Dict[str, Dict[str, MessageOptionTypedDict]] = {}
+# The (protobuf_pkg, message name) that have been completely parsed.
+# `_global_message_option_dict` may contain the dict being parsed, so it cannot be used to check without lock
+_parsed_message_set: Set[Tuple[str, str]] = set()
+_parse_lock: Lock = Lock()
+
+
+def clear_message_option_cache() -> None:
+    with _parse_lock:
+        # Clear the dict of each package in place, because the created parser still holds and writes to it
+        for message_option_dict in _global_message_option_dict.values():
+            message_option_dict.clear()
+        _parsed_message_set.clear()
 
 
 class ParseFromPbOption(object):
@@ -16,33 +29,39 @@ class ParseFromPbOption(object):
 
     def __init__(self, message: Type[Message]):
         self.message = message
-        self._message_option_dict: Dict[str, MessageOptionTypedDict] = {}
-        if self.protobuf_pkg not in _global_message_option_dict:
-            _global_message_option_dict[self.protobuf_pkg] = self._message_option_dict
-        else:
-            self._message_option_dict = _global_message_option_dict[self.protobuf_pkg]
+        self._message_option_dict: Dict[str, MessageOptionTypedDict] = _global_message_option_dict.setdefault(
+            self.protobuf_pkg, {}
+        )
 
     def parse(self) -> Dict[str, MessageOptionTypedDict]:
         descriptor: Descriptor = self.message.DESCRIPTOR
-        if descriptor.name in self._message_option_dict:
+        parsed_key = (self.protobuf_pkg, descriptor.name)
+        # Reading does not need lock, only parsing needs to be serialized
+        if parsed_key in _parsed_message_set:
             return self._message_option_dict
 
-        self._message_option_dict[descriptor.name] = self.get_message_option_dict_from_desc(descriptor)
+        with _parse_lock:
+            if parsed_key not in _parsed_message_set:
+                self._message_option_dict[descriptor.name] = self.get_message_option_dict_from_desc(descriptor)
+                _parsed_message_set.add(parsed_key)
         return self._message_option_dict
 
     def get_message_option_dict_from_desc(self, descriptor: Descriptor) -> MessageOptionTypedDict:  # noqa:C901
         """Extract the information of each field through the Options of Protobuf Message"""
-        if descriptor.name in self._message_option_dict:
-            return self._message_option_dict[descriptor.name]
+        cache_message_option_dict = self._message_option_dict.get(descriptor.name, None)
+        if cache_message_option_dict is not None:
+            return cache_message_option_dict
         message_option_dict: MessageOptionTypedDict = {"message": {}, "one_of": {}, "nested": {}, "metadata": {}}
 
         # Options for processing Messages
+        disabled_option_name_tuple = (f"{self.protobuf_pkg}.disabled", f"{self.protobuf_pkg}.ignored")
         for option_descriptor, option_value in descriptor.GetOptions().ListFields():
             # If parsing is disabled, Options will not continue to be parsed, and empty information will be set
-            if (option_descriptor.full_name == f"{self.protobuf_pkg}.disabled" and option_value) or (
-                option_descriptor.full_name == f"{self.protobuf_pkg}.ignored" and option_value
-            ):
+            if option_value and option_descriptor.full_name in disabled_option_name_tuple:
                 return message_option_dict
+        # The dict is filled in place, so it can be cached before the fields are parsed,
+        # and the message that references itself(directly or indirectly) only needs to be parsed once
+        self._message_option_dict[descriptor.name] = message_option_dict
         # Handle one_ofs of Message
         one_of_dict: Dict[str, OneOfTypedDict] = {}
         for one_of in descriptor.oneofs:
@@ -114,5 +133,4 @@ class ParseFromPbOption(object):
                     message_option_dict["nested"][sub_field.message_type.name] = self.get_message_option_dict_from_desc(
                         sub_field.message_type
                     )
-        self._message_option_dict[descriptor.name] = message_option_dict
         return message_option_dict
@@ -18,9 +18,9 @@ from protobuf_to_pydantic.constant import (
 )
 from protobuf_to_pydantic.exceptions import WaitingToCompleteException
 from protobuf_to_pydantic.field_info_rule.field_info_param import (
-    FieldInfoParamModel,
     field_info_param_dict_handle,
     field_info_param_dict_migration_v2_handler,
+    gen_field_info_param_dict,
 )
 from protobuf_to_pydantic.field_info_rule.protobuf_option_to_field_info.comment import (
     gen_field_rule_info_dict_from_field_comment_dict,
@@ -121,11 +121,17 @@ class FileDescriptorProtoToCode(BaseP2C):
         if self.config.parse_comment:
             leading_comments_list: List[str] = []
             trailing_comments_list: List[str] = []
+            comment_prefix = self.config.comment_prefix + ":"
             for container, comments in (
                 (leading_comments_list, leading_comments),
                 (trailing_comments_list, trailing_comments),
             ):
+                # Use `split` instead of `splitlines` to keep the trailing empty line of the comment
                 for line in comments.split("\n"):
+                    if comment_prefix not in line:
+                        # Fast path: most lines are ordinary comments
+                        container.append(line)
+                        continue
                     field_dict = get_dict_from_comment(self.config.comment_prefix, line)
                     if not field_dict:
                         container.append(line)
@@ -352,7 +358,7 @@ class FileDescriptorProtoToCode(BaseP2C):
         if field_info_dict:
             raw_validator_dict = field_info_dict.get("validator", {})
 
-            field_info_dict = FieldInfoParamModel(**field_info_dict).to_dict()  # type: ignore
+            field_info_dict = gen_field_info_param_dict(field_info_dict)  # type: ignore
 
             skip = field_info_dict.pop("skip", False)
             if nested_message_name:
@@ -591,7 +597,10 @@ class FileDescriptorProtoToCode(BaseP2C):
 
             comment = self.source_code_info_by_scl.get(tuple(scl_prefix + [index]))
             if self.config.parse_comment and comment:
-                for line in comment.leading_comments.split("\n"):
+                comment_prefix = self.config.comment_prefix + ":"
+                for line in comment.leading_comments.splitlines():
+                    if comment_prefix not in line:
+                        continue
                     one_of_comment_dict = get_dict_from_comment(self.config.comment_prefix, line)
                     if not one_of_comment_dict:
                         continue
@@ -7,7 +7,8 @@ import sys
 from contextlib import contextmanager
 from dataclasses import MISSING
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Tuple, Type, Union
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional, Pattern, Tuple, Type, Union
 
 from pydantic import BaseConfig, BaseModel, create_model
 
@@ -36,9 +37,13 @@ class Timedelta(timedelta):
         return timedelta(seconds=v)
 
 
+# Match the position before a capitalized word, or the position between a lowercase letter(or digit) and
+# an uppercase letter, e.g. `HTTPResponseCode` -> `HTTP_Response_Code`
+_camel_to_snake_pattern: Pattern[str] = re.compile("(?<=.)(?=[A-Z][a-z])|(?<=[a-z0-9])(?=[A-Z])")
+
+
 def camel_to_snake(name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    return _camel_to_snake_pattern.sub("_", name).lower()
 
 
 def create_pydantic_model(
@@ -62,6 +67,34 @@ def create_pydantic_model(
     )
 
 
+def _duration_to_timedelta(value: Duration) -> timedelta:
+    return timedelta(microseconds=value.ToMicroseconds())
+
+
+def _timestamp_to_float(value: Timestamp) -> float:
+    return value.ToMicroseconds() / 1000000
+
+
+def _list_like_to_list(value: Any) -> list:
+    return [replace_protobuf_type_to_python_type(i) for i in value]
+
+
+_list_like_type_tuple: Tuple[type, ...] = (list, *ProtobufRepeatedType)
+
+
+@lru_cache(maxsize=None)
+def _get_replace_protobuf_type_handler(value_type: type) -> Optional[Callable[[Any], Any]]:
+    # The handler only depends on the type of value, so resolve it once for each type
+    if issubclass(value_type, Duration):
+        return _duration_to_timedelta
+    elif issubclass(value_type, Timestamp):
+        return _timestamp_to_float
+    elif issubclass(value_type, _list_like_type_tuple):
+        return _list_like_to_list
+    else:
+        return None
+
+
 def replace_protobuf_type_to_python_type(value: Any) -> Any:
     """
     protobuf.Duration -> datetime.timedelta
@@ -69,27 +102,23 @@ def replace_protobuf_type_to_python_type(value: Any) -> Any:
     like list type -> list
     other type -> raw...
     """
-    if isinstance(value, Duration):
-        return timedelta(microseconds=value.ToMicroseconds())
-    elif isinstance(value, Timestamp):
-        return value.ToMicroseconds() / 1000000
-    elif isinstance(value, (list, *ProtobufRepeatedType)):
-        return [replace_protobuf_type_to_python_type(i) for i in value]
-    else:
+    handler = _get_replace_protobuf_type_handler(type(value))  # type: ignore[arg-type]
+    if handler is None:
         return value
+    return handler(value)
+
+
+@lru_cache(maxsize=None)
+def _get_comment_prefix_pattern(comment_prefix: str) -> Pattern[str]:
+    # Match the line like `{comment_prefix}:{json}` or `#{comment_prefix}:{json}`
+    return re.compile(rf"^#?[^\S\n]*{re.escape(comment_prefix)}:(.*)$", re.MULTILINE)
 
 
 def get_dict_from_comment(comment_prefix: str, comment: str) -> dict:
     _dict: dict = {}
     try:
-        for line in comment.split("\n"):
-            if line.startswith("#"):
-                line = line[1:]
-            line = line.strip()
-            if not line.startswith(f"{comment_prefix}:"):
-                continue
-            line = line.replace(f"{comment_prefix}:", "")
-            for key, value in json.loads(line.replace("\\\\", "\\")).items():
+        for match in _get_comment_prefix_pattern(comment_prefix).finditer(comment):
+            for key, value in json.loads(match.group(1).replace("\\\\", "\\")).items():
                 if not _dict.get(key):
                     _dict[key] = value
                 else:
@@ -118,12 +147,18 @@ def get_pyproject_content(pyproject_file_path: str) -> str:
 
     if pyproject_file_path:
         with open(pyproject_file_path, "r") as f:
-            return "".join(f.readlines())
+            return f.read()
     return ""
 
 
 # flake8: noqa: C901
-def format_content(content_str: str, pyproject_file_path: str = "") -> str:
+@lru_cache(maxsize=None)
+def _get_formatter_list(pyproject_file_path: str) -> Tuple[Callable[[str], str], ...]:
+    """Get the formatters enabled by pyproject.toml.
+
+    The config will not change during the run, so the result is cached to avoid parsing pyproject.toml
+    and creating the config of each formatter every time the code is formatted
+    """
     pyproject_dict: dict = {}
     try:
         import toml  # type: ignore
@@ -141,6 +176,7 @@ def format_content(content_str: str, pyproject_file_path: str = "") -> str:
     except KeyError:
         p2p_format_dict = {}
 
+    formatter_list: List[Callable[[str], str]] = []
     try:
         import isort  # type: ignore
     except ImportError:
@@ -148,9 +184,9 @@ def format_content(content_str: str, pyproject_file_path: str = "") -> str:
     else:
         if p2p_format_dict.get("isort", True):
             if pyproject_file_path:
-                content_str = isort.code(content_str, config=isort.Config(settings_file=pyproject_file_path))
+                formatter_list.append(partial(isort.code, config=isort.Config(settings_file=pyproject_file_path)))
             else:
-                content_str = isort.code(content_str)
+                formatter_list.append(isort.code)
 
     try:
         import autoflake  # type: ignore
@@ -159,19 +195,19 @@ def format_content(content_str: str, pyproject_file_path: str = "") -> str:
     else:
         autoflake_dict: dict = {}
         try:
-            for k, v in pyproject_dict["tool"]["autoflake"].items():
+            autoflake_config_dict: dict = pyproject_dict["tool"]["autoflake"]
+        except KeyError:
+            pass
+        else:
+            # Only inspect the signature when there is a config to filter
+            autoflake_param_key_set = inspect.signature(autoflake.fix_code).parameters.keys()
+            for k, v in autoflake_config_dict.items():
                 k = k.replace("-", "_")
-                if k not in inspect.signature(autoflake.fix_code).parameters.keys():
+                if k not in autoflake_param_key_set:
                     continue
                 autoflake_dict[k] = v
-
-        except KeyError:
-            pass
         if p2p_format_dict.get("autoflake", True):
-            if autoflake_dict:
-                content_str = autoflake.fix_code(content_str, **autoflake_dict)
-            else:
-                content_str = autoflake.fix_code(content_str)
+            formatter_list.append(partial(autoflake.fix_code, **autoflake_dict))
 
     try:
         import black  # type: ignore
@@ -192,10 +228,14 @@ def format_content(content_str: str, pyproject_file_path: str = "") -> str:
         except KeyError:
             pass
         if p2p_format_dict.get("black", True):
-            if black_config_dict:
-                content_str = black.format_str(content_str, mode=black.Mode(**black_config_dict))
-            else:
-                content_str = black.format_str(content_str, mode=black.Mode())
+            formatter_list.append(partial(black.format_str, mode=black.Mode(**black_config_dict)))
+    # Return a tuple so that callers cannot modify the cached result
+    return tuple(formatter_list)
+
+
+def format_content(content_str: str, pyproject_file_path: str = "") -> str:
+    for formatter in _get_formatter_list(pyproject_file_path):
+        content_str = formatter(content_str)
     return content_str
 
 
@@ -0,0 +1,114 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+import pytest
+from pydantic import Field, create_model
+
+from protobuf_to_pydantic._pydantic_adapter import is_v1
+from protobuf_to_pydantic.customer_validator import rule
+
+
+class TestNowTimestamp:
+    def test_default_now_factory_use_time(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        call_list: list = []
+
+        def _time() -> float:
+            call_list.append(1)
+            return 1600000000.0
+
+        monkeypatch.setattr(rule.time, "time", _time)
+        assert rule._get_now_timestamp(True) == 1600000000.0
+        assert call_list
+
+        rule.timestamp_gt_now_validator(1600000001, "a", True)
+        with pytest.raises(ValueError):
+            rule.timestamp_lt_now_validator(1600000001, "a", True)
+
+    def test_set_now_default_factory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(rule.time, "time", pytest.fail)
+        try:
+            rule.set_now_default_factory(lambda: datetime.fromtimestamp(1600000000))
+            assert rule._get_now_timestamp(True) == 1600000000.0
+        finally:
+            rule.set_now_default_factory(rule._default_now_factory)
+        assert rule._now_default_factory is rule._default_now_factory
+
+    def test_field_value_factory(self) -> None:
+        assert rule._get_now_timestamp(lambda: datetime.fromtimestamp(1600000000)) == 1600000000.0
+        assert abs(rule._get_now_timestamp(True) - time.time()) < 1
+
+
+class TestTimestampWithin:
+    def test_bounds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(rule.time, "time", lambda: 1600000000.0)
+        within = timedelta(seconds=10)
+        for value in (1599999990, 1600000000, 1600000010, datetime.fromtimestamp(1600000010)):
+            assert rule.timestamp_within_validator(value, "a", within) == value
+        for value in (1599999989.9, 1600000010.1, datetime.fromtimestamp(1600000011)):
+            with pytest.raises(ValueError):
+                rule.timestamp_within_validator(value, "a", within)
+
+    def test_error_message(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(rule.time, "time", lambda: 1600000000.0)
+        with pytest.raises(ValueError) as e:
+            rule.timestamp_within_validator(1600000011, "a", timedelta(seconds=10))
+        assert str(e.value) == (
+            f"a must between {datetime.fromtimestamp(1599999990)}[1599999990.0]"
+            f" and {datetime.fromtimestamp(1600000010)}[1600000010.0], not 1600000011"
+        )
+
+    def test_error_message_keep_now_factory_tz(self) -> None:
+        now = datetime.fromtimestamp(1600000000, tz=timezone(timedelta(hours=8)))
+        within = timedelta(seconds=10)
+        try:
+            rule.set_now_default_factory(lambda: now)
+            with pytest.raises(ValueError) as e:
+                rule.timestamp_within_validator(1600000011, "a", within)
+        finally:
+            rule.set_now_default_factory(rule._default_now_factory)
+        assert str(e.value) == (
+            f"a must between {now - within}[1599999990.0] and {now + within}[1600000010.0], not 1600000011"
+        )
+
+
+@pytest.mark.skipif(is_v1, reason="Only for pydantic v2 validators")
+class TestV2TimestampIn:
+    @staticmethod
+    def _gen_model(key: str, value: Any) -> Any:
+        from pydantic import field_validator
+
+        from protobuf_to_pydantic.customer_validator import v2
+
+        json_schema_extra: Any = {key: value}
+        validators: Dict[str, Any] = {
+            f"a_{key}_validator": field_validator("a", mode="after")(getattr(v2, f"{key}_validator"))
+        }
+        return create_model("DemoModel", a=(Any, Field(json_schema_extra=json_schema_extra)), __validators__=validators)
+
+    def test_timestamp_in(self) -> None:
+        model = self._gen_model("timestamp_in", [1600000000])
+        for value in (1600000000, 1600000000.0, datetime.fromtimestamp(1600000000)):
+            assert model(a=value).a == value
+        for value in (1600000001, 1600000001.0, datetime.fromtimestamp(1600000001)):
+            with pytest.raises(ValueError):
+                model(a=value)
+
+    def test_timestamp_not_in(self) -> None:
+        model = self._gen_model("timestamp_not_in", [1600000000])
+        for value in (1600000001, 1600000001.0, datetime.fromtimestamp(1600000001)):
+            assert model(a=value).a == value
+        for value in (1600000000, 1600000000.0, datetime.fromtimestamp(1600000000)):
+            with pytest.raises(ValueError):
+                model(a=value)
+
+    def test_timestamp_within_message(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(rule.time, "time", lambda: 1600000000.0)
+        model = self._gen_model("timestamp_within", timedelta(seconds=10))
+        assert model(a=1600000010).a == 1600000010
+        with pytest.raises(ValueError) as e:
+            model(a=1600000011)
+        assert (
+            f"a must between {datetime.fromtimestamp(1599999990)}[1599999990.0]"
+            f" and {datetime.fromtimestamp(1600000010)}[1600000010.0], not 1600000011"
+        ) in str(e.value)
@@ -0,0 +1,29 @@
+import pytest
+from google.protobuf import __version__
+
+from protobuf_to_pydantic import msg_to_pydantic_model
+from protobuf_to_pydantic._pydantic_adapter import is_v1
+
+if __version__ > "4.0.0":
+    if is_v1:
+        from example.proto_pydanticv1.example.example_proto.validate import demo_pb2
+    else:
+        from example.proto_pydanticv2.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+else:
+    if is_v1:
+        from example.proto_3_20_pydanticv1.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+    else:
+        from example.proto_3_20_pydanticv2.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+
+
+class TestMsgToPydanticModelCache:
+    def test_return_cache_model(self) -> None:
+        model = msg_to_pydantic_model(demo_pb2.NestedMessage, parse_msg_desc_method="PGV")
+        assert msg_to_pydantic_model(demo_pb2.NestedMessage, parse_msg_desc_method="PGV") is model
+
+    def test_check_param_when_cache_hit(self) -> None:
+        msg_to_pydantic_model(demo_pb2.NestedMessage, parse_msg_desc_method="PGV")
+        with pytest.raises(ValueError):
+            msg_to_pydantic_model(demo_pb2.NestedMessage, parse_msg_desc_method="/no/such/path")
+        with pytest.raises(ValueError):
+            msg_to_pydantic_model(demo_pb2.NestedMessage, parse_msg_desc_method=pytest)
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from google.protobuf import __version__
+
+from protobuf_to_pydantic._pydantic_adapter import is_v1
+from protobuf_to_pydantic.field_info_rule.types import MessageOptionTypedDict
+from protobuf_to_pydantic.get_message_option import get_message_option_dict_from_message_with_pgv
+from protobuf_to_pydantic.get_message_option.from_message_option.base import clear_message_option_cache
+from protobuf_to_pydantic.get_message_option.from_message_option.from_pgv import _ParseFromPbOption
+
+if __version__ > "4.0.0":
+    if is_v1:
+        from example.proto_pydanticv1.example.example_proto.validate import demo_pb2
+    else:
+        from example.proto_pydanticv2.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+else:
+    if is_v1:
+        from example.proto_3_20_pydanticv1.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+    else:
+        from example.proto_3_20_pydanticv2.example.example_proto.validate import demo_pb2  # type: ignore[no-redef]
+
+
+def _get_structure(message_option_dict: MessageOptionTypedDict) -> dict:
+    # The validator objects are created on each parse and cannot be compared, so only compare the parsed names
+    return {
+        "message": sorted(message_option_dict["message"]),
+        "one_of": sorted(message_option_dict["one_of"]),
+        "nested": {k: _get_structure(v) for k, v in message_option_dict["nested"].items()},
+    }
+
+
+class TestMessageOptionCache:
+    def test_clear_and_reparse(self) -> None:
+        message_option_dict = get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage)
+        assert get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage) is message_option_dict
+        nested_message_option_dict = message_option_dict["NestedMessage"]
+        expect_structure = _get_structure(nested_message_option_dict)
+
+        clear_message_option_cache()
+        new_message_option_dict = get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage)
+        assert new_message_option_dict["NestedMessage"] is not nested_message_option_dict
+        assert _get_structure(new_message_option_dict["NestedMessage"]) == expect_structure
+
+    def test_parse_after_clear(self) -> None:
+        expect_structure = _get_structure(
+            get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage)["NestedMessage"]
+        )
+        # The parser created before clearing the cache must not leave the message marked as parsed without data
+        parser = _ParseFromPbOption(demo_pb2.NestedMessage)
+        clear_message_option_cache()
+        parser.parse()
+        message_option_dict = get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage)
+        assert _get_structure(message_option_dict["NestedMessage"]) == expect_structure
+
+    def test_concurrent_parse(self) -> None:
+        expect_structure = _get_structure(
+            get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage)["NestedMessage"]
+        )
+        clear_message_option_cache()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            result_list = list(
+                executor.map(lambda _: get_message_option_dict_from_message_with_pgv(demo_pb2.NestedMessage), range(32))
+            )
+        assert all(result is result_list[0] for result in result_list)
+        assert _get_structure(result_list[0]["NestedMessage"]) == expect_structure
@@ -0,0 +1,14 @@
+from protobuf_to_pydantic.util import get_dict_from_comment
+
+
+class TestGetDictFromComment:
+    def test_prefix_in_value(self) -> None:
+        assert get_dict_from_comment("p2p", 'p2p:{"e":"p2p:y"}') == {"e": "p2p:y"}
+        assert get_dict_from_comment("p2p", '#p2p:{"e":"p2p:y"}') == {"e": "p2p:y"}
+
+    def test_merge_lines(self) -> None:
+        comment = 'p2p:{"a": [1], "b": {"c": 1}}\nother comment\n# p2p:{"a": [2], "b": {"d": 2}}'
+        assert get_dict_from_comment("p2p", comment) == {"a": [1, 2], "b": {"c": 1, "d": 2}}
+
+    def test_miss_default(self) -> None:
+        assert get_dict_from_comment("p2p", 'p2p:{"miss_default": true}') == {"required": True}